@@ -1,5 +1,8 @@
+import time
+from dataclasses import dataclass
+
 import numpy as np
-from PyQt5.QtCore import QObject, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QObject, QThread, pyqtSignal, QMutex
 
 from src.utils import config
 from src.core.laminar_flow import VesselPhantom
@@ -9,48 +12,71 @@ from src.core.beam_angles import AngleManager
 from src.core.velocity_estimation import velocity_estimation
 
 
+@dataclass
+class FrameUpdate:
+    """
+    Single cross-thread payload per worker tick. Only the fields whose
+    update interval fired this tick are populated; the rest stay None.
+    """
+    flow: tuple = None  # (x, y, z) arrays
+    rf: tuple = None  # (rf_signal, time_axis)
+    spec: tuple = None  # (time, velocities, power in dB)
+    metrics: tuple = None  # (v_true, v_measured, error)
+
+
 class SimulationWorker(QThread):
     """
     Runs the laminar flow simulation with RF generation in a separate thread.
     Emits scatterer positions, RF data, and spectrograms for visualization.
     OPTIMIZED: Reduced update frequency and smarter buffering.
+
+    All per-tick results travel in one FrameUpdate emission instead of four
+    separate signals, so each tick costs a single queued cross-thread hop.
     """
-    flow_updated = pyqtSignal(object, object, object)  # x, y, z arrays
-    rf_updated = pyqtSignal(object, object)  # rf_signal, time_axis
-    spectrum_updated = pyqtSignal(object, object, object)  # time, velocities, power
-    metrics_updated = pyqtSignal(float, float, float)  # v_true, v_measured, error
+    frame_ready = pyqtSignal(object)  # FrameUpdate
     error = pyqtSignal(str)
 
-    def __init__(self, doppler_angle=60):
+    def __init__(self, doppler_angle=60, phantom=None):
         super().__init__()
         self._is_running = True
         self.doppler_angle = doppler_angle
+        # Optional pre-built phantom so restarts reuse the scatterer state
+        # instead of re-sampling and re-allocating it per run
+        self.phantom = phantom
+        # Guards the cached trig in rf_gen/spec_gen/angle_mgr so a live
+        # slider update can't interleave with the worker mid-computation.
+        self._angle_lock = QMutex()
 
     def stop(self):
         self._is_running = False
 
     def set_angle(self, angle_deg):
-        """Update simulation angle dynamically."""
-        self.doppler_angle = angle_deg
-        # Update components if they exist
-        if hasattr(self, 'rf_gen'):
-            self.rf_gen.set_angle(angle_deg)
-        if hasattr(self, 'angle_mgr'):
-            self.angle_mgr.set_angle(angle_deg)
-        # Note: SpectrogramGenerator currently ignores live updates in compute_spectrogram, 
-        # but re-init isn't needed if it just uses constants or we don't change f0/c.
-        # Ideally SpecGen should also have set_angle if it cached cos_theta.
-        # Based on code, it uses self.doppler_angle in init, so we should update it.
-        if hasattr(self, 'spec_gen'):
-            self.spec_gen.doppler_angle = np.radians(angle_deg)
+        """Update simulation angle dynamically (atomic w.r.t. the run loop)."""
+        self._angle_lock.lock()
+        try:
+            self.doppler_angle = angle_deg
+            # Update components if they exist
+            if hasattr(self, 'rf_gen'):
+                self.rf_gen.set_angle(angle_deg)
+            if hasattr(self, 'angle_mgr'):
+                self.angle_mgr.set_angle(angle_deg)
+            # SpectrogramGenerator caches cos(theta), so go through its
+            # set_angle rather than poking doppler_angle directly.
+            if hasattr(self, 'spec_gen'):
+                self.spec_gen.set_angle(angle_deg)
+        finally:
+            self._angle_lock.unlock()
 
     def run(self):
         try:
-            # Initialize Physics Objects
-            phantom = VesselPhantom(
-                config.VESSEL_RADIUS, config.VESSEL_LENGTH,
-                config.V_MAX_TRUE, config.NUM_SCATTERERS, config.GATE_DEPTH
-            )
+            # Initialize Physics Objects (reuse the injected phantom when
+            # the controller carries one across runs)
+            phantom = self.phantom
+            if phantom is None:
+                phantom = VesselPhantom(
+                    config.VESSEL_RADIUS, config.VESSEL_LENGTH,
+                    config.V_MAX_TRUE, config.NUM_SCATTERERS, config.GATE_DEPTH
+                )
 
             # Initialize RF generator and spectrogram processor
             self.rf_gen = RFGenerator(doppler_angle_deg=self.doppler_angle)
@@ -59,95 +85,147 @@ class SimulationWorker(QThread):
             velocity_est = velocity_estimation()
             self.angle_mgr.set_angle(self.doppler_angle)
 
-            # Simulation parameters
+            # Simulation parameters. Constants read on every tick are bound
+            # to locals here — inside the loop a config.X access costs a
+            # module-dict lookup per read, a local costs none.
             dt = 1.0 / config.FPS
             rf_duration = config.RF_WINDOW_DURATION
-
-            # Optimized buffering
-            rf_buffer = []
-            rf_time_buffer = []
+            stft_window = config.STFT_WINDOW_SIZE
+            stft_overlap = config.STFT_OVERLAP
+            v_true = float(config.V_MAX_TRUE)
+
+            # Double-buffered flow snapshots: the emit hands the UI a pointer
+            # into one buffer while the next frame fills the other, so no
+            # per-frame allocation/copy fan-out. Receivers must treat the
+            # arrays as read-only until the next flow frame.
+            flow_bufs = [np.empty((3, config.NUM_SCATTERERS), dtype=np.float32)
+                         for _ in range(2)]
+            flow_idx = 0
+
+            # Optimized buffering: preallocated circular ndarrays (sized on
+            # the first RF sample) instead of list append/pop + concatenate
             max_buffer_size = 5  # REDUCED from 10
+            rf_ring = None
+            time_ring = None
+            ring_size = 0
+            ring_ptr = 0
+            ring_filled = 0
+            rf_len = 0
 
             frame_count = 0
             flow_update_interval = 2     # Update flow plot every 2 frames
             rf_update_interval = 5       # Update RF every 5 frames (was 3)
             spec_update_interval = 10    # Update spectrogram every 10 frames
 
-            # Loop
+            # Loop (deadline-paced: sleep only the remainder of each frame
+            # budget instead of a full interval after doing the work)
+            next_tick = time.perf_counter() + dt
             while self._is_running:
                 # Move Scatterers
                 phantom.update(dt)
 
+                update = FrameUpdate()
+
                 # Emit flow positions (LESS FREQUENTLY)
                 if frame_count % flow_update_interval == 0:
-                    self.flow_updated.emit(
-                        phantom.x.copy(),
-                        phantom.y.copy(),
-                        phantom.z_rel.copy()
-                    )
+                    buf = flow_bufs[flow_idx]
+                    np.copyto(buf, phantom.state[:3])
+                    flow_idx ^= 1
+                    update.flow = (buf[0], buf[1], buf[2])
 
                 # Generate RF data periodically
                 if frame_count % rf_update_interval == 0:
-                    # Generate RF sample
-                    rf_signal, time_axis = self.rf_gen.generate_rf_sample(
-                        phantom, rf_duration
-                    )
-
-                    # Emit RF signal
-                    self.rf_updated.emit(rf_signal.copy(), time_axis.copy())
-
-                    # Accumulate for spectrogram
-                    rf_buffer.append(rf_signal)
-                    rf_time_buffer.append(time_axis)
-
-                    # Keep buffer size limited
-                    if len(rf_buffer) > max_buffer_size:
-                        rf_buffer.pop(0)
-                        rf_time_buffer.pop(0)
+                    # Generate RF sample (angle held constant for the window)
+                    self._angle_lock.lock()
+                    try:
+                        rf_signal, time_axis = self.rf_gen.generate_rf_sample(
+                            phantom, rf_duration
+                        )
+                    finally:
+                        self._angle_lock.unlock()
+
+                    # Decimate to display resolution (~1000 points) here so
+                    # the UI thread does no decimation and the payload
+                    # crossing the signal/slot boundary stays small. The
+                    # signal is freshly allocated per sample and never
+                    # mutated afterwards, so views are safe to hand out.
+                    ds = max(1, rf_len // 1000)
+                    update.rf = (rf_signal[::ds], time_axis[::ds])
+
+                    # Accumulate for spectrogram in the circular ring
+                    if rf_ring is None:
+                        rf_len = len(rf_signal)
+                        ring_size = max_buffer_size * rf_len
+                        rf_ring = np.empty(ring_size, dtype=rf_signal.dtype)
+                        time_ring = np.empty(ring_size, dtype=time_axis.dtype)
+
+                    rf_ring[ring_ptr:ring_ptr + rf_len] = rf_signal
+                    time_ring[ring_ptr:ring_ptr + rf_len] = time_axis
+                    ring_ptr = (ring_ptr + rf_len) % ring_size
+                    ring_filled = min(ring_filled + rf_len, ring_size)
 
                 # Generate spectrogram LESS FREQUENTLY
-                if frame_count % spec_update_interval == 0 and len(rf_buffer) >= 3:
-                    # Concatenate RF data (only when needed)
-                    rf_combined = np.concatenate(rf_buffer)
-                    time_combined = np.concatenate(rf_time_buffer)
-
-                    # Compute spectrogram
-                    spec_time, velocities, spec_power = self.spec_gen.compute_spectrogram(
-                        rf_combined, time_combined,
-                        window_size=config.STFT_WINDOW_SIZE,
-                        overlap=config.STFT_OVERLAP
-                    )
-
-                    # Emit spectrogram
-                    self.spectrum_updated.emit(
-                        spec_time.copy(),
-                        velocities.copy(),
-                        spec_power.copy()
-                    )
-
-                    # Calculate metrics
+                if frame_count % spec_update_interval == 0 and ring_filled >= 3 * rf_len:
+                    # Oldest-first view of the ring; zero-copy until it wraps
+                    if ring_filled < ring_size or ring_ptr == 0:
+                        rf_combined = rf_ring[:ring_filled]
+                        time_combined = time_ring[:ring_filled]
+                    else:
+                        rf_combined = np.concatenate((rf_ring[ring_ptr:], rf_ring[:ring_ptr]))
+                        time_combined = np.concatenate((time_ring[ring_ptr:], time_ring[:ring_ptr]))
+
+                    # Compute spectrogram (angle held constant for the block)
+                    self._angle_lock.lock()
+                    try:
+                        spec_time, velocities, spec_power = self.spec_gen.compute_spectrogram(
+                            rf_combined, time_combined,
+                            window_size=stft_window,
+                            overlap=stft_overlap
+                        )
+                    finally:
+                        self._angle_lock.unlock()
+
+                    # Calculate metrics (on linear power, before dB)
                     v_measured = self.spec_gen.estimate_max_velocity(
                         velocities, spec_power
                     )
-                    v_true = config.V_MAX_TRUE
-
-                    # Debug info (less frequent)
-                    if frame_count % 30 == 0:  # Only every 30 frames
-                        num_in_gate = np.sum(self.rf_gen._scatterers_in_gate(phantom))
-                        pass
-                        # print(f"[DEBUG] Angle: {self.doppler_angle}° | "
-                        #       f"Scatterers: {num_in_gate} | "
-                        #       f"V_measured: {v_measured:.3f} m/s")
 
                     error = velocity_est.calculate_relative_error(v_true, v_measured, angle_deg=self.doppler_angle)
 
-                    # Emit metrics
-                    self.metrics_updated.emit(float(v_true), float(v_measured), float(error))
+                    update.metrics = (v_true, float(v_measured), float(error))
+
+                    # Convert to dB here, off the GUI thread, reusing the
+                    # matrix in place — it is freshly allocated by the
+                    # batched FFT each block, so no later reader sees the
+                    # mutation. The UI consumes dB directly.
+                    np.add(spec_power, 1e-12, out=spec_power)
+                    np.log10(spec_power, out=spec_power)
+                    spec_power *= 10.0
+                    update.spec = (spec_time, velocities, spec_power)
+
+                # One queued cross-thread emission per tick, and only when
+                # at least one interval actually fired
+                if (update.flow is not None or update.rf is not None
+                        or update.spec is not None or update.metrics is not None):
+                    self.frame_ready.emit(update)
 
                 frame_count += 1
 
-                # Control frame rate
-                self.msleep(int(dt * 1000))
+                # Control frame rate against the deadline
+                now = time.perf_counter()
+                sleep_s = next_tick - now
+                if sleep_s > 0:
+                    self.msleep(int(sleep_s * 1000))
+                else:
+                    # Behind budget: skip the sleep, but still yield the
+                    # core so the GUI thread isn't starved of repaint time
+                    # during heavy spectrogram ticks.
+                    QThread.yieldCurrentThread()
+                    if sleep_s < -dt:
+                        # More than a frame behind; skip ahead instead of
+                        # death-spiraling.
+                        next_tick = now
+                next_tick += dt
 
         except Exception as e:
             self.error.emit(str(e))
@@ -170,6 +248,9 @@ class DopplerController(QObject):
         self.worker = None
         self.angle_manager = AngleManager()
         self.current_angle = self.angle_manager.get_angle()
+        # Built on first start and kept across stop/start cycles: restarting
+        # continues the same flow field rather than re-sampling 4 x N state
+        self._phantom = None
 
     def start_simulation(self, angle=None):
         """Start simulation with specified angle."""
@@ -180,12 +261,19 @@ class DopplerController(QObject):
             self.current_angle = angle
             self.angle_manager.set_angle(angle)
 
-        self.worker = SimulationWorker(doppler_angle=self.current_angle)
-        self.worker.flow_updated.connect(self._handle_flow_update)
-        self.worker.rf_updated.connect(self._handle_rf_update)
-        self.worker.spectrum_updated.connect(self._handle_spectrum_update)
-        self.worker.metrics_updated.connect(self._handle_metrics_update)
-        self.worker.error.connect(self._handle_worker_error)
+        if self._phantom is None:
+            self._phantom = VesselPhantom(
+                config.VESSEL_RADIUS, config.VESSEL_LENGTH,
+                config.V_MAX_TRUE, config.NUM_SCATTERERS, config.GATE_DEPTH
+            )
+
+        self.worker = SimulationWorker(doppler_angle=self.current_angle,
+                                       phantom=self._phantom)
+        # Explicitly queued: the worker must never run UI-bound slots
+        # synchronously, and pinning the type skips Qt's per-emit
+        # auto-connection thread check
+        self.worker.frame_ready.connect(self._handle_frame, Qt.QueuedConnection)
+        self.worker.error.connect(self._handle_worker_error, Qt.QueuedConnection)
         self.worker.start()
 
     def update_angle_live(self, angle):
@@ -209,17 +297,20 @@ class DopplerController(QObject):
             if was_running:
                 self.start_simulation(angle=new_angle)
 
-    def _handle_flow_update(self, x, y, z):
-        self.flow_update.emit(x, y, z)
-
-    def _handle_rf_update(self, rf_signal, time_axis):
-        self.rf_update.emit(rf_signal, time_axis)
-
-    def _handle_spectrum_update(self, time, velocities, power):
-        self.spectrum_update.emit(time, velocities, power)
-
-    def _handle_metrics_update(self, v_true, v_measured, error):
-        self.metrics_update.emit(v_true, v_measured, error)
+    def _handle_frame(self, update):
+        """Demultiplex a FrameUpdate into the per-category UI signals.
+
+        Runs on the UI thread, so the fan-out below is plain same-thread
+        dispatch; only the single frame_ready hop crosses threads.
+        """
+        if update.flow is not None:
+            self.flow_update.emit(*update.flow)
+        if update.rf is not None:
+            self.rf_update.emit(*update.rf)
+        if update.spec is not None:
+            self.spectrum_update.emit(*update.spec)
+        if update.metrics is not None:
+            self.metrics_update.emit(*update.metrics)
 
     def _handle_worker_error(self, msg):
         self.error_occurred.emit(msg)
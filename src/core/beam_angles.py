@@ -1,4 +1,4 @@
-import numpy as np
+import math
 from src.utils import config
 
 
@@ -8,12 +8,17 @@ class AngleManager:
     """
 
     def __init__(self):
-        self.current_angle = config.DEFAULT_ANGLE  # default
+        self.set_angle(config.DEFAULT_ANGLE)  # default
 
     def set_angle(self, angle_deg):
         """Set the current Doppler angle."""
         if config.MIN_ANGLE <= angle_deg <= config.MAX_ANGLE:  # Angle validation (0–180°)
             self.current_angle = angle_deg
+            # Memoize trig once per angle change so the getters below are
+            # plain attribute loads on the hot spectrogram/metrics path.
+            self._rad = math.radians(angle_deg)
+            self._cos = math.cos(self._rad)
+            self._sin = math.sin(self._rad)
         else:
             raise ValueError(f"Angle must be between {config.MIN_ANGLE} and {config.MAX_ANGLE}")
 
@@ -23,7 +28,7 @@ class AngleManager:
 
     def get_angle_radians(self):
         """Get current angle in radians."""
-        return np.radians(self.current_angle)
+        return self._rad
 
     def get_doppler_factor(self):
         """
@@ -32,7 +37,7 @@ class AngleManager:
         Returns:
             Cosine of current angle
         """
-        return np.cos(self.get_angle_radians())
+        return self._cos
 
     def get_angle_info(self):
         """
@@ -41,11 +46,10 @@ class AngleManager:
         Returns:
             Dictionary with angle parameters
         """
-        angle_rad = self.get_angle_radians()
         return {
             'angle_deg': self.current_angle,
-            'angle_rad': angle_rad,
-            'cos_theta': np.cos(angle_rad),
-            'sin_theta': np.sin(angle_rad),
-            'doppler_factor': self.get_doppler_factor()
+            'angle_rad': self._rad,
+            'cos_theta': self._cos,
+            'sin_theta': self._sin,
+            'doppler_factor': self._cos
         }
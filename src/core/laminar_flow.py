@@ -11,22 +11,37 @@ class VesselPhantom:
         self.v_max = v_max
         self.center_depth = center_depth
 
+        # Single contiguous float32 state matrix (rows: x, y, z_rel, vx) so
+        # fields that are traversed together share cache lines and the flow
+        # positions can be snapshot with one memcpy (state[:3].copy()).
+        self.state = np.empty((4, num_scatterers), dtype=np.float32)
+        self.x = self.state[0]
+        self.y = self.state[1]
+        self.z_rel = self.state[2]
+        self.vx = self.state[3]
+
         # Initialize Random Positions
-        self.x = np.random.uniform(-length / 2, length / 2, num_scatterers)
+        self.x[:] = np.random.uniform(-length / 2, length / 2, num_scatterers)
         r = radius * np.sqrt(np.random.uniform(0, 1, num_scatterers))
         theta = np.random.uniform(0, 2 * np.pi, num_scatterers)
-        self.y = r * np.cos(theta)
-        self.z_rel = r * np.sin(theta)
+        self.y[:] = r * np.cos(theta)
+        self.z_rel[:] = r * np.sin(theta)
 
         # Laminar Velocity Profile
         r_sq = self.y ** 2 + self.z_rel ** 2
-        self.vx = v_max * (1 - r_sq / (radius ** 2))
+        self.vx[:] = v_max * (1 - r_sq / (radius ** 2))
+
+        # Scratch buffer for the axpy-style position update below
+        self._tmp = np.empty(num_scatterers, dtype=np.float32)
 
     def update(self, dt):
         """Move scatterers and recycle."""
-        self.x += self.vx * dt
-        # Recycle boundaries
-        out_upper = self.x > self.length / 2
-        self.x[out_upper] -= self.length
-        out_lower = self.x < -self.length / 2
-        self.x[out_lower] += self.length
+        # x += vx * dt without allocating the vx * dt intermediate
+        np.multiply(self.vx, dt, out=self._tmp)
+        np.add(self.x, self._tmp, out=self.x)
+        # Recycle boundaries with a single in-place periodic wrap instead of
+        # two boolean-mask passes (no mask temporaries, one pass over x).
+        half = self.length / 2
+        np.add(self.x, half, out=self.x)
+        np.mod(self.x, self.length, out=self.x)
+        np.subtract(self.x, half, out=self.x)
@@ -1,4 +1,8 @@
+import math
+
 import numpy as np
+from scipy import fft as sp_fft
+
 from src.utils import config
 
 
@@ -8,10 +12,53 @@ class SpectrogramGenerator:
     """
 
     def __init__(self, doppler_angle_deg=60.0):
-        self.doppler_angle = np.radians(doppler_angle_deg)
         self.f0 = config.TRANSDUCER_FREQ
         self.c = config.SPEED_OF_SOUND
         self.fs = config.PRF  # Use PRF for slow-time baseband simulation
+        self._window = None  # cached Hamming window, built on first use
+        self._freqs = None  # cached shifted frequency axis, per window_size
+        self._velocities = None  # cached velocity axis, per angle
+        self.set_angle(doppler_angle_deg)
+
+        # Warm pocketfft's plan cache for the shape compute_spectrogram
+        # actually uses, so the first real frame doesn't pay the planning
+        # cost on the simulation thread.
+        sp_fft.fft(np.zeros((1, config.STFT_WINDOW_SIZE), dtype=np.complex64),
+                   axis=1, workers=-1)
+
+    def set_angle(self, angle_deg):
+        """Update the Doppler angle and cache its trig for the STFT path."""
+        self.doppler_angle = math.radians(angle_deg)
+
+        # Cache cos(theta) once per angle change instead of recomputing it
+        # on every compute_spectrogram call.
+        cos_theta = math.cos(self.doppler_angle)
+        if abs(cos_theta) < 1e-3:  # Handle 90 degree case
+            cos_theta = 1e-3 * math.copysign(1.0, cos_theta) if cos_theta != 0 else 1e-3
+        self.cos_theta = cos_theta
+        self._velocities = None  # velocity axis depends on the angle
+
+    def _get_axes(self, window_size):
+        """Return cached (freqs, velocities); rebuilt only when the window
+        size or the Doppler angle changes, not on every spectrogram."""
+        if self._freqs is None or len(self._freqs) != window_size:
+            self._freqs = sp_fft.fftshift(sp_fft.fftfreq(window_size, 1 / self.fs))
+            # Permutation that reorders unshifted FFT bins to match the
+            # shifted axes, applied once per spectrogram instead of
+            # fftshift-copying every segment's spectrum.
+            self._shift_order = sp_fft.fftshift(np.arange(window_size))
+            self._velocities = None
+        if self._velocities is None:
+            # Doppler frequency f_d = 2*f0*(v_proj)/c with v_proj = v*cos(theta);
+            # dividing by cos(theta) restores the true (clinical) velocity scale.
+            self._velocities = self._freqs * self.c / (2 * self.f0 * self.cos_theta)
+        return self._freqs, self._velocities
+
+    def _get_window(self, window_size):
+        """Return the Hamming window for window_size, reusing the last one."""
+        if self._window is None or len(self._window) != window_size:
+            self._window = np.hamming(window_size).astype(np.float32)
+        return self._window
 
     def compute_spectrogram(self, rf_signal, time_axis, window_size=256, overlap=0.75):
         """
@@ -33,45 +80,29 @@ class SpectrogramGenerator:
         # Number of segments
         n_segments = (len(rf_signal) - window_size) // hop_size + 1
 
-        # Frequency axis (Doppler shifts)
-        freqs = np.fft.fftshift(np.fft.fftfreq(window_size, 1 / self.fs))
-
-        # Convert to velocities using Doppler equation
-        # velocities = freqs * self.c / (2 * self.f0 * np.cos(self.doppler_angle))
-        # Doppler frequency f_d = 2*f0*(v_proj)/c where v_proj = v_true * cos(theta)
-        # Corrected (Clinical Flow Velocity):
-        # We divide by cos(theta) to restore the true velocity scale
-        cos_theta = np.cos(self.doppler_angle)
-        if abs(cos_theta) < 1e-3:  # Handle 90 degree case
-            cos_theta = 1e-3 * np.sign(cos_theta) if cos_theta != 0 else 1e-3
-
-        velocities = freqs * self.c / (2 * self.f0 * cos_theta)
+        # Frequency/velocity axes (cached per window_size and angle)
+        freqs, velocities = self._get_axes(window_size)
 
-        # Initialize spectrogram
-        spec_power = np.zeros((len(freqs), n_segments))
-        spec_time = np.zeros(n_segments)
+        # Hamming window (cached; window_size is constant between calls)
+        window = self._get_window(window_size)
 
-        # Hamming window
-        window = np.hamming(window_size)
+        # Frame the signal with a zero-copy strided view and run one batched
+        # FFT over all segments instead of a Python loop of per-segment FFTs.
+        frames = np.lib.stride_tricks.sliding_window_view(rf_signal, window_size)
+        frames = frames[::hop_size][:n_segments] * window
 
-        for i in range(n_segments):
-            start_idx = i * hop_size
-            end_idx = start_idx + window_size
+        # pocketfft via scipy can split the batched transform across cores
+        spectrum = sp_fft.fft(frames, axis=1, workers=-1)
 
-            if end_idx > len(rf_signal):
-                break
+        # |X|^2 without the sqrt/re-square round trip of np.abs(...)**2
+        spec_power = spectrum.real ** 2 + spectrum.imag ** 2
 
-            segment = rf_signal[start_idx:end_idx] * window
+        # Single gather to shifted bin order, then transpose (a view) to the
+        # (freq, time) layout the callers expect
+        spec_power = spec_power[:, self._shift_order].T
 
-            # FFT
-            spectrum = np.fft.fftshift(np.fft.fft(segment))
-            spec_power[:, i] = np.abs(spectrum) ** 2
-
-            # Time stamp (center of window)
-            spec_time[i] = time_axis[start_idx + window_size // 2]
-
-        # Remove unused columns
-        spec_power = spec_power[:, :n_segments]
+        # Time stamps (center of each window), vectorized
+        spec_time = time_axis[np.arange(n_segments) * hop_size + window_size // 2]
 
         return spec_time, velocities, spec_power
 
@@ -83,15 +114,25 @@ class SpectrogramGenerator:
         Returns:
             v_max_measured: Estimated maximum velocity [m/s]
         """
-        # Average spectrum over time
-        mean_spectrum = np.mean(spec_power, axis=1)
-
-        # Find peak in positive velocities
-        positive_vel_idx = velocities > 0
-        if np.sum(positive_vel_idx) == 0:
-            return 0.0
-
-        peak_idx = np.argmax(mean_spectrum[positive_vel_idx])
-        v_max_measured = velocities[positive_vel_idx][peak_idx]
-
-        return v_max_measured
+        # Find peak in positive velocities. The velocity axis is monotonic
+        # (fftshifted bins scaled by a constant), so the positive side is a
+        # contiguous slice located with a binary search — no boolean mask or
+        # fancy-index temporaries. cos(theta) < 0 (angles > 90°) flips the
+        # axis to descending, putting the positive side at the front.
+        # Time-averaging happens after the slice, so only the rows that can
+        # hold the peak are ever reduced.
+        n = len(velocities)
+        if velocities[-1] >= velocities[0]:
+            start = np.searchsorted(velocities, 0, side='right')
+            if start >= n:
+                return 0.0
+            mean_spectrum = spec_power[start:].mean(axis=1, dtype=np.float32)
+            peak_idx = start + int(mean_spectrum.argmax())
+        else:
+            stop = n - np.searchsorted(velocities[::-1], 0, side='right')
+            if stop <= 0:
+                return 0.0
+            mean_spectrum = spec_power[:stop].mean(axis=1, dtype=np.float32)
+            peak_idx = int(mean_spectrum.argmax())
+
+        return velocities[peak_idx]
@@ -2,21 +2,65 @@ import numpy as np
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QLabel, QPushButton, QFrame, QMessageBox, QGroupBox,
                              QSizePolicy, QDial)
-from PyQt5.QtCore import Qt, pyqtSlot
+from PyQt5.QtCore import Qt, pyqtSlot, QTimer
 from PyQt5.QtGui import QCloseEvent, QFont
-import matplotlib
-
-matplotlib.use('Qt5Agg')
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-
 from src.utils import config, cleanup
 from src.controller import DopplerController
-from matplotlib.ticker import MultipleLocator
+
+# Matplotlib is imported lazily: it costs a noticeable slice of cold
+# startup, and nothing before the plot area is built needs it. _ensure_mpl
+# fills these module globals on first use.
+FigureCanvas = None
+Figure = None
+cm = None
+MultipleLocator = None
+
+
+def _ensure_mpl():
+    """Import and configure matplotlib on first use."""
+    global FigureCanvas, Figure, cm, MultipleLocator
+    if FigureCanvas is not None:
+        return
+    import matplotlib
+    matplotlib.use('Qt5Agg')
+    # Simplify long polylines aggressively and chunk Agg path rendering;
+    # the RF trace is the only dense line and doesn't need sub-pixel
+    # fidelity
+    matplotlib.rcParams['path.simplify_threshold'] = 1.0
+    matplotlib.rcParams['agg.path.chunksize'] = 10000
+    from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
+    from matplotlib.figure import Figure as _Figure
+    from matplotlib import cm as _cm
+    from matplotlib.ticker import MultipleLocator as _MultipleLocator
+    FigureCanvas = FigureCanvasQTAgg
+    Figure = _Figure
+    cm = _cm
+    MultipleLocator = _MultipleLocator
 
 
 # --- Main Window (GUI) ---
 class MainWindow(QMainWindow):
+    # Upper bound on scatter points actually rendered; the stride below
+    # adapts so render cost stays constant however many scatterers the
+    # simulation runs
+    MAX_VISIBLE_PARTICLES = 400
+
+    # Shared sidebar group-box style, built once instead of per group box
+    GROUPBOX_STYLE = (
+        "QGroupBox { font-weight: bold; color: #00e5ff; border: 1px solid #333; margin-top: 10px; } "
+        "QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 5px; }"
+    )
+
+    # Error color bands as property-keyed rules in one stylesheet set at
+    # construction; band changes flip the property instead of re-parsing
+    # CSS. The unkeyed rule is the pre-measurement default.
+    ERROR_BAND_QSS = (
+        'QLabel { color: #00e5ff; font-size: 12px; font-weight: bold; } '
+        'QLabel[band="good"] { color: #4caf50; font-size: 12px; font-weight: bold; } '
+        'QLabel[band="warn"] { color: #ff9800; font-size: 12px; font-weight: bold; } '
+        'QLabel[band="bad"] { color: #f44336; font-size: 12px; font-weight: bold; }'
+    )
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("SonoMetric: Laminar Flow Simulation with Pulsed Doppler")
@@ -35,9 +79,74 @@ class MainWindow(QMainWindow):
         self.v_measured = 0.0
         self.error_percent = 0.0
 
+        # Coalesced full-figure redraws: slots request one, the event loop
+        # services at most one per batch of back-to-back signals.
+        self._redraw_pending = False
+
+        # Fixed-rate repaint: controller signals only stash their latest
+        # payload; this timer applies what's pending at ~30 Hz so render
+        # work is capped at display rate however fast the worker emits.
+        self._pending_flow = None
+        self._pending_rf = None
+        self._pending_spec = None
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setInterval(33)
+        self._repaint_timer.timeout.connect(self._flush_all)
+
+        # Dial throttle: QDial fires valueChanged for every intermediate
+        # position during a drag; forward at most ~30 updates/s to the
+        # simulation while the label still tracks instantly.
+        self._pending_angle = None
+        self._angle_throttle = QTimer(self)
+        self._angle_throttle.setSingleShot(True)
+        self._angle_throttle.setInterval(33)
+        self._angle_throttle.timeout.connect(self._commit_angle)
+
         self.setup_ui()
 
+    def _commit_angle(self):
+        """Forward the most recent dial value to the controller."""
+        if self._pending_angle is not None:
+            angle = self._pending_angle
+            self._pending_angle = None
+            self.controller.update_angle_live(angle)
+
+    def _flush_all(self):
+        """Apply the most recent pending frame of each kind, then render."""
+        if self._pending_flow is not None:
+            x, y = self._pending_flow
+            self._pending_flow = None
+            self._apply_flow(x, y)
+        if self._pending_rf is not None:
+            rf_signal, time_axis = self._pending_rf
+            self._pending_rf = None
+            self._apply_rf(rf_signal, time_axis)
+        if self._pending_spec is not None:
+            spec_time, velocities, spec_power = self._pending_spec
+            self._pending_spec = None
+            self._apply_spec(spec_time, velocities, spec_power)
+
+    def _schedule_redraw(self):
+        """Request a full-figure redraw, coalescing back-to-back requests.
+
+        The controller can emit flow/spectrum updates in the same tick; each
+        slot calling canvas.draw_idle() directly would schedule its own full
+        render. Posting a single zero-delay timer means one draw services
+        them all.
+        """
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            QTimer.singleShot(0, self._flush_redraw)
+
+    def _flush_redraw(self):
+        self._redraw_pending = False
+        self._canvas_draw_idle()
+
     def setup_ui(self):
+        # Pull in matplotlib now; deferring it out of module import lets
+        # the Qt application come up before the plotting stack loads
+        _ensure_mpl()
+
         # Central Widget & Layout
         central_widget = QWidget()
         central_widget.setStyleSheet(
@@ -72,8 +181,10 @@ class MainWindow(QMainWindow):
         self.btn_start = QPushButton("START FLOW SIMULATION")
         self.btn_start.setCursor(Qt.PointingHandCursor)
         self.btn_start.setFixedHeight(50)
+        # Both visual states live in one stylesheet keyed on a dynamic
+        # property; toggling flips the property instead of re-parsing CSS
         self.btn_start.setStyleSheet("""
-            QPushButton {
+            QPushButton[state="idle"] {
                 background-color: #d32f2f;
                 color: #fff;
                 border-radius: 4px;
@@ -81,10 +192,22 @@ class MainWindow(QMainWindow):
                 letter-spacing: 1px;
                 font-size: 14px;
             }
-            QPushButton:hover {
+            QPushButton[state="idle"]:hover {
                 background-color: #f44336;
             }
+            QPushButton[state="running"] {
+                background-color: #ff9800;
+                color: #000;
+                border-radius: 4px;
+                font-weight: bold;
+                letter-spacing: 1px;
+                font-size: 14px;
+            }
+            QPushButton[state="running"]:hover {
+                background-color: #ffb74d;
+            }
         """)
+        self.btn_start.setProperty("state", "idle")
         self.btn_start.clicked.connect(self.toggle_simulation)
         btn_layout.addWidget(self.btn_start)
         sidebar_layout.addLayout(btn_layout)
@@ -97,8 +220,7 @@ class MainWindow(QMainWindow):
 
         # 2. Angle Controls (Continuous Slider)
         grp_angle = QGroupBox("ANGLE OF INSONATION (θ)")
-        grp_angle.setStyleSheet(
-            "QGroupBox { font-weight: bold; color: #00e5ff; border: 1px solid #333; margin-top: 10px; } QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 5px; }")
+        grp_angle.setStyleSheet(self.GROUPBOX_STYLE)
         angle_layout = QVBoxLayout()
 
         # Label to show current angle
@@ -138,18 +260,20 @@ class MainWindow(QMainWindow):
 
         # 3. Quantitative Analysis (NOW LIVE)
         grp_metrics = QGroupBox("QUANTITATIVE ANALYSIS")
-        grp_metrics.setStyleSheet(
-            "QGroupBox { font-weight: bold; color: #00e5ff; border: 1px solid #333; margin-top: 10px; } QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 5px; }")
+        grp_metrics.setStyleSheet(self.GROUPBOX_STYLE)
         metrics_layout = QVBoxLayout()
 
-        self.lbl_v_true = self.create_metric_widget("TRUE Vmax:", "-- m/s")
-        self.lbl_v_measured = self.create_metric_widget("MEASURED Vmax:", "-- m/s")
-        self.lbl_error = self.create_metric_widget("RELATIVE ERROR:", "-- %")
+        self.lbl_v_true, self.val_true = self.create_metric_widget("TRUE Vmax:", "-- m/s")
+        self.lbl_v_measured, self.val_measured = self.create_metric_widget("MEASURED Vmax:", "-- m/s")
+        self.lbl_error, self.val_error = self.create_metric_widget("RELATIVE ERROR:", "-- %")
 
         metrics_layout.addWidget(self.lbl_v_true)
         metrics_layout.addWidget(self.lbl_v_measured)
         metrics_layout.addWidget(self.lbl_error)
 
+        self.val_error.setStyleSheet(self.ERROR_BAND_QSS)
+        self._error_band = None  # last applied color band (0/1/2)
+
         grp_metrics.setLayout(metrics_layout)
         sidebar_layout.addWidget(grp_metrics)
 
@@ -183,11 +307,16 @@ class MainWindow(QMainWindow):
         content_layout.setContentsMargins(20, 20, 20, 20)
         content_layout.setSpacing(20)
 
-        # Matplotlib Figure for all plots (using subplots)
-        self.fig = Figure(facecolor='#121212')
+        # Matplotlib Figure for all plots (using subplots). Constrained
+        # layout is cheaper than manual adjust + tight_layout-style passes,
+        # both at first draw (window-open latency) and on resize.
+        self.fig = Figure(facecolor='#121212', layout='constrained')
         self.canvas = FigureCanvas(self.fig)
         self.canvas.setStyleSheet("background-color: #121212; border: 1px solid #333;")
         self.canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        # The canvas lives as long as the window, so caching the bound
+        # method saves two attribute lookups per coalesced redraw
+        self._canvas_draw_idle = self.canvas.draw_idle
         content_layout.addWidget(self.canvas)
 
         main_layout.addWidget(content_area)
@@ -197,6 +326,8 @@ class MainWindow(QMainWindow):
         self.simulation_running = False
 
     def create_metric_widget(self, label, initial_value):
+        """Build a metric row; returns (row widget, value label) so callers
+        hold the value label directly instead of rediscovering it."""
         w = QWidget()
         l = QHBoxLayout(w)
         l.setContentsMargins(0, 5, 0, 5)
@@ -204,11 +335,10 @@ class MainWindow(QMainWindow):
         lbl.setStyleSheet("color: #888; font-size: 12px;")
         val = QLabel(initial_value)
         val.setStyleSheet("color: #00e5ff; font-size: 12px; font-weight: bold;")
-        val.setObjectName("value_label")
         l.addWidget(lbl)
         l.addStretch()
         l.addWidget(val)
-        return w
+        return w, val
 
     def init_plots(self):
         """Initialize all plots: Flow, RF, Spectrum."""
@@ -218,8 +348,6 @@ class MainWindow(QMainWindow):
         self.ax_rf = self.fig.add_subplot(2, 2, 3)  # Bottom Left
         self.ax_spec = self.fig.add_subplot(2, 2, 4)  # Bottom Right
 
-        self.fig.subplots_adjust(hspace=0.4, wspace=0.25, top=0.92, bottom=0.08, left=0.08, right=0.95)
-
         # 1. Laminar Flow
         self.ax_flow.set_facecolor('#000000')
         self.ax_flow.set_title("LAMINAR FLOW SIMULATION (Blood Flow Model)", color='#e0e0e0', fontsize=11, loc='left',
@@ -237,8 +365,27 @@ class MainWindow(QMainWindow):
         self.ax_flow.axhline(-config.VESSEL_RADIUS, color='#555', linewidth=2, linestyle='-')
         self.ax_flow.set_xlim(-config.VESSEL_LENGTH / 2, config.VESSEL_LENGTH / 2)
         self.ax_flow.set_ylim(-config.VESSEL_RADIUS * 2.5, config.VESSEL_RADIUS * 2.5)
+        # Limits are pinned above; keep Matplotlib from re-deriving them
+        # from artist data on every draw
+        self.ax_flow.set_autoscale_on(False)
+
+        # Marker-only Line2D instead of ax.scatter: set_data just swaps two
+        # arrays, where PathCollection.set_offsets rebuilds per-point
+        # transforms — a much cheaper update for identical-looking dots
+        self.scatter_plot, = self.ax_flow.plot(
+            [], [], linestyle='None', marker='o', markersize=3.5,
+            markerfacecolor='#ff1744', markeredgecolor='none', alpha=0.5
+        )
+        # Animated: rendered by the blit path in _apply_flow, skipped by
+        # full draws. The flow axis limits are pinned above, so its
+        # background (grid, walls, labels) is static between resizes.
+        self.scatter_plot.set_animated(True)
+        self._flow_bg = None
 
-        self.scatter_plot = self.ax_flow.scatter([], [], s=12, c='#ff1744', alpha=0.5, edgecolors='none')
+        # Preallocated fixed-size coordinate pools for the flow markers,
+        # refilled in place each frame
+        self._flow_x = np.empty(self.MAX_VISIBLE_PARTICLES, dtype=np.float32)
+        self._flow_y = np.empty(self.MAX_VISIBLE_PARTICLES, dtype=np.float32)
 
         # 2. RF Data Stream
         self.setup_rf_axis()
@@ -246,24 +393,72 @@ class MainWindow(QMainWindow):
         # 3. Doppler Spectrum
         self.setup_spectrum_axis()
 
+        # A resize re-renders the whole figure, so any cached blit
+        # backgrounds are stale afterwards; every completed full draw then
+        # refreshes them for free (draw_event fires after the render, when
+        # text shaping and static artists are already in the buffer).
+        self.canvas.mpl_connect('resize_event', self._on_canvas_resize)
+        self.canvas.mpl_connect('draw_event', self._on_canvas_draw)
+
         self.canvas.draw()
 
+    def _on_canvas_resize(self, event):
+        """Drop cached blit backgrounds until the post-resize draw lands."""
+        self._rf_bg = None
+        self._flow_bg = None
+
+    def _on_canvas_draw(self, event):
+        """Recapture blit backgrounds from the freshly rendered canvas.
+
+        Full draws (spectrogram updates, resizes) skip the animated RF
+        lines and flow scatter, so the freshly blitted traces would be
+        wiped until their next frame arrives. Re-draw them here from
+        their retained data on top of the new background so every full
+        draw leaves the panels populated.
+        """
+        self._rf_bg = self.canvas.copy_from_bbox(self.ax_rf.bbox)
+        self._flow_bg = self.canvas.copy_from_bbox(self.ax_flow.bbox)
+        # draw_artist only — the draw in progress presents the buffer, and
+        # blitting from inside the draw_event handler would recurse into
+        # the widget's paint event.
+        if len(self.line_rf_i.get_xdata()):
+            self.ax_rf.draw_artist(self.line_rf_i)
+            self.ax_rf.draw_artist(self.line_rf_q)
+        if len(self.scatter_plot.get_xdata()):
+            self.ax_flow.draw_artist(self.scatter_plot)
+
     def setup_rf_axis(self):
         """Setup RF data plot."""
         self.ax_rf.set_facecolor('#000000')
         self.ax_rf.set_title("I/Q BASEBAND SIGNAL", color='#e0e0e0', fontsize=10, loc='left', weight='bold')
-        self.ax_rf.set_xlabel("Time [s]", color='#666', fontsize=8)
+        self.ax_rf.set_xlabel("Time in window [s]", color='#666', fontsize=8)
         self.ax_rf.set_ylabel("Amplitude", color='#666', fontsize=8)
         for spine in self.ax_rf.spines.values():
             spine.set_color('#333')
         self.ax_rf.tick_params(colors='#666', labelsize=7)
         self.ax_rf.grid(True, color='#222', linestyle='-', linewidth=0.5)
 
-        # Initialize empty line plots
+        # Initialize empty line plots. Animated so normal draws skip them and
+        # the blit path below owns their rendering.
         self.line_rf_i, = self.ax_rf.plot([], [], 'c-', linewidth=0.8, alpha=0.7, label='I')
         self.line_rf_q, = self.ax_rf.plot([], [], 'm-', linewidth=0.8, alpha=0.7, label='Q')
+        self.line_rf_i.set_animated(True)
+        self.line_rf_q.set_animated(True)
         self.ax_rf.legend(loc='upper right', fontsize=7, framealpha=0.3)
 
+        # The RF slot manages its own limits; disable autoscale so draws
+        # never walk the line data to recompute them
+        self.ax_rf.set_autoscale_on(False)
+
+        # Cached background for blitting; invalidated on resize/limit changes
+        self._rf_bg = None
+
+        # Preallocated contiguous float32 buffers for the displayed I/Q and
+        # time samples, refilled in place each RF frame (grown on demand)
+        self._i_buf = np.empty(1000, dtype=np.float32)
+        self._q_buf = np.empty(1000, dtype=np.float32)
+        self._t_buf = np.empty(1000, dtype=np.float32)
+
     def setup_spectrum_axis(self):
         """Setup Doppler spectrogram plot."""
         self.ax_spec.set_facecolor('#000000')
@@ -286,43 +481,89 @@ class MainWindow(QMainWindow):
         self.ax_spec.tick_params(colors='#666', labelsize=7)
         self.spectrum_image = None
 
-        # 🔴 PyQt part people forget
-        self.canvas.draw_idle()
+        # Smoothed contrast limits: seeded from percentiles on the first
+        # frame, then EMA-tracked from cheap min/max
+        self._vmin_ema = None
+        self._vmax_ema = None
+
+        # 256-entry uint8 RGBA LUT from the 'hot' colormap. The display
+        # path normalizes dB values to uint8 and indexes this LUT itself,
+        # handing AxesImage ready pixels so its per-frame norm + colormap
+        # evaluation is bypassed entirely.
+        self._hot_lut = (cm.hot(np.linspace(0.0, 1.0, 256)) * 255).astype(np.uint8)
+        self._idx_buf = None
+        self._rgba_buf = None
+
+        # Last extent pushed to the image/axes (xlim tracks it), so
+        # no-change frames skip the invalidation these setters trigger
+        self._last_extent = None
+
+        # The displayed velocity band is fixed; set it once, not per frame,
+        # and keep the axis from autoscaling to the image extent
+        self.ax_spec.set_ylim(-0.8, 0.8)
+        self.ax_spec.set_autoscale_on(False)
+
+        # Reused dB buffer for the cropped/downsampled spectrogram display
+        self._db_buf = None
+
+        # Memoized +/-1 m/s crop: the worker hands back the same cached
+        # velocity axis every frame, so the row range is recomputed only
+        # when the axis itself changes (i.e. on an angle change)
+        self._vel_key = None
+        self._vel_slice = None
+
+    def _velocity_slice(self, velocities):
+        """Contiguous row slice covering the physiological -1..1 m/s band.
+
+        The velocity axis is monotonic (scaled, shifted FFT bins), so the
+        band is a slice found by binary search — no boolean mask pass or
+        fancy-index copy per frame. Descending axes (angles past 90 deg,
+        cos(theta) < 0) are searched through a reversed view.
+        """
+        # Key on endpoint values, not id(): the worker rebuilds its cached
+        # axis on angle changes, and a freed old array's address can be
+        # reused by the same-sized replacement, which would serve a stale
+        # slice. The endpoints pin the cos(theta) scaling uniquely.
+        key = (float(velocities[0]), float(velocities[-1]), len(velocities))
+        if key != self._vel_key:
+            n = len(velocities)
+            if velocities[-1] >= velocities[0]:
+                lo = np.searchsorted(velocities, -1.0, side='left')
+                hi = np.searchsorted(velocities, 1.0, side='right')
+            else:
+                rev = velocities[::-1]
+                lo = n - np.searchsorted(rev, 1.0, side='right')
+                hi = n - np.searchsorted(rev, -1.0, side='left')
+            self._vel_slice = slice(int(lo), int(hi))
+            self._vel_key = key
+        return self._vel_slice
 
     def toggle_simulation(self):
         if not self.simulation_running:
             current_angle = self.controller.get_current_angle()
             self.controller.start_simulation(angle=current_angle)
             self.simulation_running = True
+            self._repaint_timer.start()
             self.btn_start.setText("STOP SIMULATION")
-            self.btn_start.setStyleSheet("""
-                QPushButton {
-                    background-color: #ff9800;
-                    color: #000;
-                    border-radius: 4px;
-                    font-weight: bold;
-                    letter-spacing: 1px;
-                }
-                QPushButton:hover {
-                    background-color: #ffb74d;
-                }
-            """)
+            self._set_start_button_state("running")
         else:
             self.controller.stop_simulation()
             self.simulation_running = False
+            self._repaint_timer.stop()
+            self._flush_all()  # render whatever arrived since the last tick
             self.btn_start.setText("START FLOW SIMULATION")
-            self.btn_start.setStyleSheet("""
-                QPushButton {
-                    background-color: #d32f2f;
-                    color: #fff;
-                    border-radius: 4px;
-                    font-weight: bold;
-                    letter-spacing: 1px;
-                }
-                QPushButton:hover {
-                    background-color: #f44336;
-                }
-            """)
+            self._set_start_button_state("idle")
+
+    def _set_start_button_state(self, state):
+        """Flip the button's visual state via its dynamic property.
+
+        The stylesheet set in setup_ui carries both states, so this only
+        re-polishes the widget rather than re-parsing CSS.
+        """
+        self.btn_start.setProperty("state", state)
+        style = self.btn_start.style()
+        style.unpolish(self.btn_start)
+        style.polish(self.btn_start)
 
     def change_angle(self, angle):
         """Handle angle change."""
@@ -331,9 +572,12 @@ class MainWindow(QMainWindow):
     def update_angle_label(self, value):
         """Update the label text and simulation as dial turns."""
         self.lbl_angle_value.setText(f"{value}°")
-        # Live update
-        if hasattr(self, 'controller'):
-            self.controller.update_angle_live(value)
+        # Live update, throttled: stash the value and let the single-shot
+        # timer commit the latest one (controller is built in __init__
+        # before the dial, so no hasattr probe needed in this hot slot)
+        self._pending_angle = value
+        if not self._angle_throttle.isActive():
+            self._angle_throttle.start()
 
     def on_angle_slider_released(self):
         """Final commit of angle (optional, improves clarity)."""
@@ -343,95 +587,182 @@ class MainWindow(QMainWindow):
 
     @pyqtSlot(object, object, object)
     def update_flow_plot(self, x, y, z):
-        """Updates the scatter plot with new positions. OPTIMIZED."""
-        if hasattr(self, 'scatter_plot'):
-            # Downsample for faster rendering (every 2nd point)
-            offsets = np.c_[x[::2], y[::2]]
-            self.scatter_plot.set_offsets(offsets)
+        """Stash the latest flow frame; the repaint timer renders it."""
+        self._pending_flow = (x, y)
 
-            # Use draw_idle instead of manual blit to ensure background clearing
-            self.scatter_plot.set_offsets(offsets)
-            self.canvas.draw_idle()
+    def _apply_flow(self, x, y):
+        """Updates the scatter plot with new positions. OPTIMIZED."""
+        # Downsample into the fixed visual pool with a stride derived from
+        # the particle count, filling the persistent buffers in place — no
+        # allocation, one set_data, and a bounded number of points for the
+        # renderer regardless of simulation scale
+        step = max(1, len(x) // self.MAX_VISIBLE_PARTICLES)
+        n = min(self.MAX_VISIBLE_PARTICLES, (len(x) + step - 1) // step)
+        xs = self._flow_x[:n]
+        ys = self._flow_y[:n]
+        xs[:] = x[::step][:n]
+        ys[:] = y[::step][:n]
+        self.scatter_plot.set_data(xs, ys)
+
+        # Blit just the scatter over the cached flow background instead of
+        # re-rendering axes, grid and vessel walls every physics frame.
+        # A forced draw (first frame / post-resize) refreshes the cache
+        # through the draw_event hook.
+        if self._flow_bg is None:
+            self.canvas.draw()
+        self.canvas.restore_region(self._flow_bg)
+        self.ax_flow.draw_artist(self.scatter_plot)
+        self.canvas.blit(self.ax_flow.bbox)
 
     @pyqtSlot(object, object)
     def update_rf_plot(self, rf_signal, time_axis):
+        """Stash the latest RF frame; the repaint timer renders it."""
+        self._pending_rf = (rf_signal, time_axis)
+
+    def _apply_rf(self, rf_signal, time_axis):
         """Update RF signal plot. OPTIMIZED."""
         if len(rf_signal) == 0:
             return
 
-        # Downsample if signal is too long
-        downsample_factor = max(1, len(rf_signal) // 1000)
-        rf_signal_ds = rf_signal[::downsample_factor]
-        time_axis_ds = time_axis[::downsample_factor]
-
-        # Extract I and Q components
-        i_signal = np.real(rf_signal_ds)
-        q_signal = np.imag(rf_signal_ds)
+        # The worker emits complex64; guard the boundary so an unexpected
+        # complex128 payload doesn't double the bytes walked below
+        if rf_signal.dtype != np.complex64:
+            rf_signal = rf_signal.astype(np.complex64)
+
+        # The worker already decimated to display resolution; just land the
+        # samples in the preallocated buffers
+        n = len(rf_signal)
+        if n > len(self._i_buf):
+            self._i_buf = np.empty(n, dtype=np.float32)
+            self._q_buf = np.empty(n, dtype=np.float32)
+            self._t_buf = np.empty(n, dtype=np.float32)
+
+        # Copy the strided .real/.imag views (no intermediate allocation)
+        # into the preallocated buffers, so Matplotlib gets contiguous
+        # float32 data it can use without a hidden re-copy.
+        i_signal = self._i_buf[:n]
+        q_signal = self._q_buf[:n]
+        time_axis_ds = self._t_buf[:n]
+        np.copyto(i_signal, rf_signal.real)
+        np.copyto(q_signal, rf_signal.imag)
+        # Plot window-relative time: the absolute axis advances past the
+        # xlim every frame, which would force a set_xlim + background
+        # recapture (a full synchronous draw) per frame and make blitting
+        # useless. Relative to the window start, the x-range is the fixed
+        # window duration and the cached background stays valid.
+        np.subtract(time_axis, time_axis[0], out=time_axis_ds)
 
         # Update line data
         self.line_rf_i.set_data(time_axis_ds, i_signal)
         self.line_rf_q.set_data(time_axis_ds, q_signal)
 
-        # Only rescale if needed (check bounds)
+        # Only rescale if needed (check bounds). New limits redraw the ticks,
+        # so the cached background is stale and must be recaptured. The
+        # tolerance absorbs float jitter in the window span so steady-state
+        # frames never touch the limits.
         xlim = self.ax_rf.get_xlim()
-        if time_axis_ds[0] < xlim[0] or time_axis_ds[-1] > xlim[1]:
-            self.ax_rf.set_xlim(time_axis_ds[0], time_axis_ds[-1])
+        span = float(time_axis_ds[-1])
+        if xlim[0] != 0.0 or abs(xlim[1] - span) > 0.01 * span:
+            self.ax_rf.set_xlim(0.0, span)
+            self._rf_bg = None
 
         ylim = self.ax_rf.get_ylim()
         ymin, ymax = min(i_signal.min(), q_signal.min()), max(i_signal.max(), q_signal.max())
         if ymin < ylim[0] or ymax > ylim[1]:
             margin = (ymax - ymin) * 0.1
             self.ax_rf.set_ylim(ymin - margin, ymax + margin)
-
-        # Partial redraw
-        self.canvas.draw_idle()
+            self._rf_bg = None
+
+        # Blit only the two RF lines over the cached axes background rather
+        # than re-rendering the whole three-axes figure per RF frame. A
+        # forced draw (first frame / limit change) refreshes the cache
+        # through the draw_event hook.
+        if self._rf_bg is None:
+            self.canvas.draw()
+        self.canvas.restore_region(self._rf_bg)
+        self.ax_rf.draw_artist(self.line_rf_i)
+        self.ax_rf.draw_artist(self.line_rf_q)
+        self.canvas.blit(self.ax_rf.bbox)
 
     @pyqtSlot(object, object, object)
     def update_spectrum_plot(self, spec_time, velocities, spec_power):
+        """Stash the latest spectrogram; the repaint timer renders it."""
+        self._pending_spec = (spec_time, velocities, spec_power)
+
+    def _apply_spec(self, spec_time, velocities, spec_power):
         """Update Doppler spectrogram. OPTIMIZED."""
         if len(spec_time) == 0 or len(velocities) == 0 or spec_power.size == 0:
             return
 
-        # Convert to dB scale with proper floor
-        spec_db = 10 * np.log10(spec_power + 1e-12)
-
         # Focus on physiological velocity range (-1 to +1 m/s)
-        vel_mask = (velocities >= -1.0) & (velocities <= 1.0)
-        if np.sum(vel_mask) == 0:
+        vel_sl = self._velocity_slice(velocities)
+        if vel_sl.start >= vel_sl.stop:
             return
+        velocities_zoom = velocities[vel_sl]
 
-        velocities_zoom = velocities[vel_mask]
-        spec_db_zoom = spec_db[vel_mask, :]
-
-        # Downsample spectrogram if too large
-        if spec_db_zoom.shape[1] > 200:
-            step = spec_db_zoom.shape[1] // 200
-            spec_db_zoom = spec_db_zoom[:, ::step]
+        # Downsample spectrogram columns if too large (view, no copy)
+        if spec_power.shape[1] > 200:
+            step = spec_power.shape[1] // 200
+            spec_power = spec_power[:, ::step]
             spec_time = spec_time[::step]
 
-        # Create extent for imshow
-        extent = [spec_time[0], spec_time[-1], velocities_zoom[0], velocities_zoom[-1]]
+        # The worker already delivers dB; crop into the preallocated
+        # display buffer with one copy. The buffer is pinned to float32 —
+        # a wider payload is narrowed during this same copy, keeping the
+        # normalize/LUT steps single precision.
+        shape = (vel_sl.stop - vel_sl.start, spec_power.shape[1])
+        if self._db_buf is None or self._db_buf.shape != shape:
+            self._db_buf = np.empty(shape, dtype=np.float32)
+        np.copyto(self._db_buf, spec_power[vel_sl])
+        spec_db_zoom = self._db_buf
 
-        # Adaptive contrast
-        vmin = np.percentile(spec_db_zoom, 10)
-        vmax = np.percentile(spec_db_zoom, 99)
+        # Create extent for imshow
+        extent = (float(spec_time[0]), float(spec_time[-1]),
+                  float(velocities_zoom[0]), float(velocities_zoom[-1]))
+
+        # Adaptive contrast. np.percentile partition-sorts the whole crop;
+        # only the first frame pays that to seed the limits, after which a
+        # single min/max pass feeds an exponential moving average.
+        if self._vmin_ema is None:
+            self._vmin_ema = float(np.percentile(spec_db_zoom, 10))
+            self._vmax_ema = float(np.percentile(spec_db_zoom, 99))
+        else:
+            self._vmin_ema = 0.9 * self._vmin_ema + 0.1 * float(spec_db_zoom.min())
+            self._vmax_ema = 0.9 * self._vmax_ema + 0.1 * float(spec_db_zoom.max())
+        vmin, vmax = self._vmin_ema, self._vmax_ema
+
+        # Normalize to uint8 against the smoothed limits (in place on the
+        # dB buffer, which has served its purpose) and color through the
+        # cached LUT, so Matplotlib receives ready RGBA pixels
+        np.subtract(spec_db_zoom, vmin, out=spec_db_zoom)
+        if vmax > vmin:
+            spec_db_zoom *= 255.0 / (vmax - vmin)
+        np.clip(spec_db_zoom, 0.0, 255.0, out=spec_db_zoom)
+        if self._idx_buf is None or self._idx_buf.shape != spec_db_zoom.shape:
+            self._idx_buf = np.empty(spec_db_zoom.shape, dtype=np.uint8)
+            self._rgba_buf = np.empty(spec_db_zoom.shape + (4,), dtype=np.uint8)
+        self._idx_buf[...] = spec_db_zoom  # truncating cast into the buffer
+        np.take(self._hot_lut, self._idx_buf, axis=0, out=self._rgba_buf)
 
         # Update or create image
         if self.spectrum_image is None:
             self.spectrum_image = self.ax_spec.imshow(
-                spec_db_zoom, aspect='auto', origin='lower', extent=extent,
-                cmap='hot', interpolation='nearest', vmin=vmin, vmax=vmax
+                self._rgba_buf, aspect='auto', origin='lower', extent=extent,
+                interpolation='nearest'
             )
         else:
             # Just update data (MUCH faster than recreating)
-            self.spectrum_image.set_data(spec_db_zoom)
-            self.spectrum_image.set_extent(extent)
-            self.spectrum_image.set_clim(vmin, vmax)
+            self.spectrum_image.set_data(self._rgba_buf)
+            # set_extent/set_xlim invalidate the image and axes even when
+            # the values are identical; skip them on no-change frames
+            if extent != self._last_extent:
+                self.spectrum_image.set_extent(extent)
 
-        self.ax_spec.set_xlim(spec_time[0], spec_time[-1])
-        self.ax_spec.set_ylim(-0.8, 0.8)
+        if extent != self._last_extent:
+            self.ax_spec.set_xlim(extent[0], extent[1])
+            self._last_extent = extent
 
-        self.canvas.draw_idle()
+        self._schedule_redraw()
 
     @pyqtSlot(float, float, float)
     def update_metrics(self, v_true, v_measured, error):
@@ -440,28 +771,26 @@ class MainWindow(QMainWindow):
         self.v_measured = v_measured
         self.error_percent = error
 
-        # Update labels
-        val_true = self.lbl_v_true.findChild(QLabel, "value_label")
-        val_measured = self.lbl_v_measured.findChild(QLabel, "value_label")
-        val_error = self.lbl_error.findChild(QLabel, "value_label")
-
-        if val_true:
-            val_true.setText(f"{v_true:.3f} m/s")
-        if val_measured:
-            val_measured.setText(f"{v_measured:.3f} m/s")
-        if val_error:
-            val_error.setText(f"{error:.2f} %")
-            # Color code error
-            if error < 5:
-                val_error.setStyleSheet("color: #4caf50; font-size: 12px; font-weight: bold;")
-            elif error < 15:
-                val_error.setStyleSheet("color: #ff9800; font-size: 12px; font-weight: bold;")
-            else:
-                val_error.setStyleSheet("color: #f44336; font-size: 12px; font-weight: bold;")
+        # Update labels (references cached at setup time)
+        self.val_true.setText(f"{v_true:.3f} m/s")
+        self.val_measured.setText(f"{v_measured:.3f} m/s")
+        self.val_error.setText(f"{error:.2f} %")
+
+        # Color code error, but only when the band actually changes — and
+        # then by flipping the dynamic property the stylesheet (parsed once
+        # at setup) keys on, which re-polishes without touching the CSS
+        band = (error >= 5) + (error >= 15)
+        if band != self._error_band:
+            self.val_error.setProperty("band", ("good", "warn", "bad")[band])
+            style = self.val_error.style()
+            style.unpolish(self.val_error)
+            style.polish(self.val_error)
+            self._error_band = band
 
     @pyqtSlot(str)
     def handle_error(self, msg):
         self.simulation_running = False
+        self._repaint_timer.stop()
         self.btn_start.setText("START FLOW SIMULATION")
         QMessageBox.critical(self, "System Error", f"Simulation Failed:\n{msg}")
 
@@ -1,6 +1,9 @@
 import os
 import shutil
 
+# Directory names removed wholesale (and never descended into)
+_ARTIFACT_DIRS = ("__pycache__", ".idea")
+
 
 def clean_project_artifacts(root_dir=None):
     """
@@ -13,14 +16,23 @@ def clean_project_artifacts(root_dir=None):
         current_dir = os.path.dirname(os.path.abspath(__file__))
         root_dir = os.path.abspath(os.path.join(current_dir, '..', '..'))
 
-    for dirpath, dirnames, filenames in os.walk(root_dir):
-        # Modify dirnames in-place to prevent walking into removed dirs
-        # Copy list to iterate safely while modifying
-        for d in list(dirnames):
-            if d == "__pycache__" or d == ".idea":
-                full_path = os.path.join(dirpath, d)
-                try:
-                    shutil.rmtree(full_path)
-                except Exception:
-                    pass
-                dirnames.remove(d)
+    _remove_artifacts(root_dir)
+
+
+def _remove_artifacts(path):
+    """scandir-based DFS: DirEntry carries the dir/file type from the
+    directory read itself, so the walk costs one syscall per directory
+    instead of os.walk's listdir + per-entry stat. This runs at window
+    close, where the saved time is felt directly."""
+    try:
+        entries = os.scandir(path)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            if entry.name in _ARTIFACT_DIRS:
+                shutil.rmtree(entry.path, ignore_errors=True)
+            else:
+                _remove_artifacts(entry.path)